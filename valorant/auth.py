@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 
 import httpx
 
@@ -20,16 +22,30 @@ class LockFile:
 
 
 class Auth:
+    __slots__ = (
+        "client",
+        "username",
+        "password",
+        "access_token",
+        "id_token",
+        "entitlement_token",
+        "expires_at",
+        "__pas_token",
+        "__lock",
+    )
+
     def __init__(self, client: httpx.AsyncClient, username: str, password: str) -> None:
         self.client = client
 
         self.username = username
         self.password = password
 
-        self.__access_token = None
-        self.__id_token = None
-        self.__entitlement_token = None
+        self.access_token: str | None = None
+        self.id_token: str | None = None
+        self.entitlement_token: str | None = None
+        self.expires_at = 0.0
         self.__pas_token = None
+        self.__lock = asyncio.Lock()
 
     async def set_auth_cookies(self) -> None:
         await self.client.post(
@@ -45,10 +61,9 @@ class Auth:
             },
         )
 
-    async def get_access_token(self) -> str:
-        if self.__access_token is not None:
-            return self.__access_token
-
+    async def refresh(self) -> None:
+        # runs the whole login flow again, the auth session cookies may have expired too
+        await self.set_auth_cookies()
         request = (
             await self.client.put(
                 url=URLS.AUTH_URL,
@@ -72,35 +87,48 @@ class Auth:
             )
         )  # weird shit, extracts anchors from url and transforms them into a dict
 
-        self.__access_token, self.__id_token = (
-            tokens["access_token"],
-            tokens["id_token"],
-        )
-        return self.__access_token
-
-    async def get_id_token(self) -> str:
-        if self.__id_token is not None:
-            return self.__id_token
-
-        self.__access_token, self.__id_token = await self.get_access_token()
-        return self.__id_token
-
-    async def get_entitlement_token(self) -> str:
-        if self.__entitlement_token is not None:
-            return self.__entitlement_token
-
-        self.__entitlement_token = (
+        access_token = tokens["access_token"]
+        entitlement_token = (
             await self.client.post(
                 URLS.ENTITLEMENT_URL,
                 headers={
                     "Content-Type": "application/json",
-                    "Authorization": f"Bearer {await self.get_access_token()}",
+                    "Authorization": f"Bearer {access_token}",
                 },
                 json={},
             )
         ).json()["entitlements_token"]
 
-        return self.__entitlement_token
+        # only publish the tokens once all of them were fetched, a failed refresh
+        # must not leave a mismatched access/entitlement pair behind
+        self.access_token = access_token
+        self.id_token = tokens["id_token"]
+        self.entitlement_token = entitlement_token
+        # refresh a minute early so a token never expires mid request
+        self.expires_at = time.monotonic() + int(tokens.get("expires_in", 3600)) - 60
+
+    async def refresh_if_expired(self) -> bool:
+        if time.monotonic() < self.expires_at:
+            return False
+
+        async with self.__lock:
+            # another caller may have refreshed while we waited for the lock
+            if time.monotonic() < self.expires_at:
+                return False
+            await self.refresh()
+            return True
+
+    async def get_access_token(self) -> str:
+        await self.refresh_if_expired()
+        return self.access_token
+
+    async def get_id_token(self) -> str:
+        await self.refresh_if_expired()
+        return self.id_token
+
+    async def get_entitlement_token(self) -> str:
+        await self.refresh_if_expired()
+        return self.entitlement_token
 
     async def get_pas_token(self) -> str:
         if self.__pas_token is not None:
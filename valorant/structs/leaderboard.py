@@ -1,7 +1,23 @@
 import msgspec
 
 
-class LeaderBoardPlayer(msgspec.Struct, rename="camel"):
+class LeaderBoardPlayer(
+    msgspec.Struct,
+    gc=False,
+    rename={
+        "player_id": "puuid",
+        "name": "gameName",
+        "tagline": "tagLine",
+        "player_card_id": "PlayerCardID",
+        "title_id": "TitleID",
+        "is_banned": "IsBanned",
+        "is_anonymized": "IsAnonymized",
+        "leaderboard_rank": "leaderboardRank",
+        "ranked_rating": "rankedRating",
+        "wins": "numberOfWins",
+        "rank": "competitiveTier",
+    },
+):
     player_id: str
     name: str
     tagline: str
@@ -15,7 +31,21 @@ class LeaderBoardPlayer(msgspec.Struct, rename="camel"):
     rank: int
 
 
-class LeaderBoard(msgspec.Struct, rename="camel"):
+class LeaderBoard(
+    msgspec.Struct,
+    rename={
+        "deployment": "Deployment",
+        "queue": "QueueID",
+        "season_id": "SeasonID",
+        "players": "Players",
+        "total_players": "totalPlayers",
+        "immortal_starting_page": "immortalStartingPage",
+        "immortal_starting_index": "immortalStartingIndex",
+        "top_tier_rr_threshold": "topTierRRThreshold",
+        "tier_details": "tierDetails",
+        "start_index": "startIndex",
+    },
+):
     deployment: str
     queue: str
     season_id: str
@@ -24,6 +54,6 @@ class LeaderBoard(msgspec.Struct, rename="camel"):
     immortal_starting_page: int
     immortal_starting_index: int
     top_tier_rr_threshold: int
-    tier_details: list[dict]
+    tier_details: dict[str, dict]
     start_index: int
-    query: str
+    query: str | None = None
@@ -355,8 +355,22 @@ class MatchDetails(
     rounds: list[Round] | None = None
 
 
+class PlayerBorder(
+    msgspec.Struct,
+    gc=False,
+    rename={"player_id": "subject", "border_level": "preferredLevelBorder"},
+):
+    player_id: str
+    border_level: str | None = None
+
+
+class MatchBorders(msgspec.Struct):
+    players: list[PlayerBorder]
+
+
 class HistoryMatch(
     msgspec.Struct,
+    gc=False,
     rename={"match_id": "MatchID", "date": "GameStartTime", "queue": "QueueID"},
 ):
     match_id: str
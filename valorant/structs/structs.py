@@ -2,7 +2,6 @@ import msgspec
 
 
 class Version(msgspec.Struct):
-    # TODO: Learn to pass the contents of valorant-api.com "data" attrib to the struct without converting to json
     manifestId: str
     branch: str
     version: str
@@ -11,3 +10,8 @@ class Version(msgspec.Struct):
     riotClientVersion: str
     riotClientBuild: str
     buildDate: str
+
+
+class VersionResponse(msgspec.Struct):
+    status: int
+    data: Version
@@ -2,11 +2,16 @@
 Classes and methods related to Valorant API calls
 """
 
+import asyncio
 import base64
-import json
+import time
+from functools import cached_property
+from typing import Any
+from urllib.parse import quote
 
 import httpx
 import msgspec.json
+import orjson
 import requests
 
 from valorant.auth import Auth
@@ -18,32 +23,159 @@ from valorant.structs.match import (
     MatchDetails,
     HistoryMatch,
     HistoryMatchResponse,
+    MatchBorders,
 )
-from valorant.structs.structs import Version
+from valorant.structs.structs import VersionResponse
 from valorant.structs.user import User
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# reused decoders skip the per-call type lookup for the largest payloads
+_history_decoder = msgspec.json.Decoder(HistoryMatchResponse)
+_match_details_decoder = msgspec.json.Decoder(MatchDetails)
+_match_borders_decoder = msgspec.json.Decoder(MatchBorders)
+_leaderboard_decoder = msgspec.json.Decoder(LeaderBoard)
+
+
+def _json(response: httpx.Response) -> Any:
+    return orjson.loads(response.content)
+
+
 class Valorant:
+    # seconds to keep content, prices, config and item upgrades,
+    # they only change with patches
+    static_cache_ttl = 3600
+
     def __init__(self, username: str, password: str) -> None:
-        self.client = httpx.AsyncClient()
-        self.auth = Auth(self.client, username, password)
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=8),
+        )
 
-        build = requests.get("https://valorant-api.com/v1/version").json()["data"][
-            "riotClientBuild"
-        ]
-        self.client.headers.update(
-            {
-                "User-Agent": f"RiotClient/{build} riot-status (Windows;10;;Professional, x64)",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept": "application/json, text/plain, */*",
-            }
+        version = requests.get("https://valorant-api.com/v1/version", timeout=30)
+        self.client_version = msgspec.json.decode(
+            version.content, type=VersionResponse
+        ).data
+        base_headers = {
+            "User-Agent": f"RiotClient/{self.client_version.riotClientBuild} riot-status (Windows;10;;Professional, x64)",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept": "application/json, text/plain, */*",
+        }
+        self.client.headers.update(base_headers)
+
+        # auth keeps its own client so the login flow never carries the cached
+        # pd/glz Authorization and entitlement headers set on self.client
+        self.auth = Auth(
+            httpx.AsyncClient(http2=True, headers=base_headers), username, password
         )
 
+        self._auth_headers: dict[str, str] = {}
+        # access token the cached auth headers were built from
+        self._headers_token: str | None = None
+        self._static_cache: dict[str, tuple[float, Any]] = {}
         self.__region = None
         self.__user = None
 
+        # filled in by start(), see _build_urls
+        self._player_id: str | None = None
+        self._pd_server: str | None = None
+        self._glz_server: str | None = None
+        self._url_content: str | None = None
+        self._url_account_xp: str | None = None
+        self._url_loadout: str | None = None
+        self._url_penalties: str | None = None
+        self._url_config: str | None = None
+        self._url_prices: str | None = None
+        self._url_store: str | None = None
+        self._url_wallet: str | None = None
+        self._url_item_upgrades: str | None = None
+        self._pd_mmr_prefix: str | None = None
+        self._pd_history_prefix: str | None = None
+        self._pd_matches_prefix: str | None = None
+        self._pd_contracts_prefix: str | None = None
+        self._pd_owned_prefix: str | None = None
+        self._pd_leaderboard_prefix: str | None = None
+        self._glz_pregame_player_prefix: str | None = None
+        self._glz_pregame_match_prefix: str | None = None
+        self._glz_current_player_prefix: str | None = None
+        self._glz_current_match_prefix: str | None = None
+
     async def start(self) -> None:
-        await self.auth.set_auth_cookies()
+        await self.auth.refresh()
+        self._refresh_auth_headers()
+        await self._build_urls()
+
+    def _refresh_auth_headers(self) -> None:
+        self._headers_token = self.auth.access_token
+        self._auth_headers.update(
+            {
+                "Authorization": f"Bearer {self.auth.access_token}",
+                "X-Riot-Entitlements-JWT": self.auth.entitlement_token,
+                "X-Riot-ClientPlatform": self.client_platform.decode(),
+                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
+            }
+        )
+        self.client.headers.update(self._auth_headers)
+
+    async def _ensure_auth(self) -> None:
+        if self._headers_token is None:
+            raise RuntimeError("Valorant.start() must be awaited before using the API")
+
+        await self.auth.refresh_if_expired()
+        # the tokens may also have been rotated by a direct Auth getter call
+        # (e.g. XMPP), so compare against the token the headers were built from
+        if self.auth.access_token is not self._headers_token:
+            self._refresh_auth_headers()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        await self._ensure_auth()
+        return await self.client.request(method, url, **kwargs)
+
+    async def _get(self, url: str) -> httpx.Response:
+        return await self._request("GET", url)
+
+    async def _post(self, url: str, body: bytes | None = None) -> httpx.Response:
+        if body is None:
+            return await self._request("POST", url)
+        return await self._request("POST", url, headers=_JSON_HEADERS, content=body)
+
+    async def _put(self, url: str, body: bytes) -> httpx.Response:
+        return await self._request("PUT", url, headers=_JSON_HEADERS, content=body)
+
+    async def _build_urls(self) -> None:
+        region = await self.get_region()
+        self._player_id = (await self.get_user()).player_id
+        self._pd_server = await self.get_pd_server()
+        self._glz_server = await self.get_glz_server()
+
+        self._url_content = f"{self._pd_server}{API.CONTENT}"
+        self._url_account_xp = f"{self._pd_server}{API.ACCOUNT_XP}/{self._player_id}"
+        self._url_loadout = (
+            f"{self._pd_server}{API.PERSONALIZATION}/{self._player_id}/playerloadout"
+        )
+        self._url_penalties = f"{self._pd_server}{API.PENALTIES}"
+        self._url_config = f"{self._pd_server}{API.CONFIG}/{region.region}"
+        self._url_prices = f"{self._pd_server}{API.PRICES}"
+        self._url_store = f"{self._pd_server}{API.STORE}/{self._player_id}"
+        self._url_wallet = f"{self._pd_server}{API.WALLET}/{self._player_id}"
+        self._url_item_upgrades = f"{self._pd_server}{API.ITEM_UPGRADES}"
+
+        # prefixes for endpoints that take an id, completed with plain concatenation
+        self._pd_mmr_prefix = self._pd_server + API.MMR + "/"
+        self._pd_history_prefix = self._pd_server + API.HISTORY + "/"
+        self._pd_matches_prefix = self._pd_server + API.MATCHES + "/"
+        self._pd_contracts_prefix = self._pd_server + API.CONTRACTS + "/"
+        self._pd_owned_prefix = (
+            self._pd_server + API.OWNED + "/" + self._player_id + "/"
+        )
+        self._pd_leaderboard_prefix = self._pd_server + API.LEADERBOARD + "/"
+        self._glz_pregame_player_prefix = self._glz_server + API.PREGAME_PLAYER + "/"
+        self._glz_pregame_match_prefix = self._glz_server + API.PREGAME_MATCH + "/"
+        self._glz_current_player_prefix = (
+            self._glz_server + API.CURRENT_GAME_PLAYER + "/"
+        )
+        self._glz_current_match_prefix = self._glz_server + API.CURRENT_GAME_MATCH + "/"
 
     async def get_pd_server(self) -> str:
         region = await self.get_region()
@@ -53,38 +185,36 @@ class Valorant:
         region = await self.get_region()
         return f"https://glz-{region.region}-1.{region.shard}.a.pvp.net"
 
-    @property
+    async def _cached_get(self, url: str) -> Any:
+        # every hit returns the same decoded object, callers must not mutate it
+        cached = self._static_cache.get(url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        response = await self._get(url)
+        data = _json(response)
+        # error bodies are passed through but never cached
+        if response.is_success:
+            self._static_cache[url] = (time.monotonic() + self.static_cache_ttl, data)
+        return data
+
+    @cached_property
     def client_platform(self) -> bytes:
         return base64.b64encode(
-            json.dumps(
+            orjson.dumps(
                 {
                     "platformType": "PC",
                     "platformOS": "Windows",
                     "platformOSVersion": "10.0.19042.1.256.64bit",
                     "platformChipset": "Unknown",
                 }
-            ).encode("utf-8")
+            )
         )
 
-    @property
-    def client_version(self) -> Version:
-        version = requests.get(
-            "https://valorant-api.com/v1/version", timeout=30
-        ).json()["data"]
-
-        return Version(**version)
-
     async def get_user(self) -> User:
         if self.__user is not None:
             return self.__user
-        user_info = await self.client.post(
-            URLS.USERINFO_URL,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-            json={},
-        )
+        user_info = await self._post(URLS.USERINFO_URL, b"{}")
         user = msgspec.json.decode(user_info.content, type=User)
         self.__user = user
         return user
@@ -93,75 +223,33 @@ class Valorant:
         if self.__region is not None:
             return self.__region
 
-        region = await self.client.put(
-            "https://riot-geo.pas.si.riotgames.com/pas/v1/product/valorant",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-            json={"id_token": await self.auth.get_id_token()},
+        region = await self._put(
+            URLS.REGION_URL, orjson.dumps({"id_token": self.auth.id_token})
         )
-        region = regions[region.json()["affinities"]["live"]]
+        region = regions[_json(region)["affinities"]["live"]]
         self.__region = region
         return region
 
     async def get_content(self) -> dict:
-        content = await self.client.get(
-            f"{await self.get_pd_server()}{API.CONTENT}",
-            headers={
-                "X-Riot-ClientPlatform": f"{self.client_platform}",
-                "X-Riot-ClientVersion": f"{self.client_version.riotClientVersion}",
-                "X-Riot-Entitlements-JWT": f"{await self.auth.get_entitlement_token()}",
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return content.json()
+        return await self._cached_get(self._url_content)
 
     async def get_account_xp(self) -> AccountXP:
-        account_xp = await self.client.get(
-            f"{await self.get_pd_server()}{API.ACCOUNT_XP}/{(await self.get_user()).player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
+        account_xp = await self._get(self._url_account_xp)
 
         return msgspec.json.decode(account_xp.content, type=AccountXP)
 
     async def get_loadout(self) -> Loadout:
-        loadout = await self.client.get(
-            f"{await self.get_pd_server()}{API.PERSONALIZATION}/{(await self.get_user()).player_id}/playerloadout",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
+        loadout = await self._get(self._url_loadout)
         return msgspec.json.decode(loadout.content, type=Loadout)
 
     async def set_loadout(self, loadout: Loadout) -> None:
-        await self.client.put(
-            f"{await self.get_pd_server()}{API.PERSONALIZATION}/{(await self.get_user()).player_id}/playerloadout",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-            json=msgspec.json.encode(loadout),
-        )
+        await self._put(self._url_loadout, msgspec.json.encode(loadout))
 
     async def get_player_mmr(self, player_id: str | None = None) -> dict:
         if player_id is None:
-            player_id = (await self.get_user()).player_id
+            player_id = self._player_id
 
-        player_mmr = await self.client.get(
-            f"{await self.get_pd_server()}{API.MMR}/{player_id}",
-            headers={
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return player_mmr.json()
+        return _json(await self._get(self._pd_mmr_prefix + player_id))
 
     async def get_match_history(
         self,
@@ -171,27 +259,46 @@ class Valorant:
     ) -> list[HistoryMatch]:
         # TODO: add queue parameter when ids are known
         if player_id is None:
-            player_id = (await self.get_user()).player_id
-
-        history = await self.client.get(
-            f"{await self.get_pd_server()}{API.HISTORY}/{player_id}?startIndex={offset}&endIndex={amount}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            player_id = self._player_id
+
+        history = await self._get(
+            self._pd_history_prefix
+            + player_id
+            + "?startIndex="
+            + str(offset)
+            + "&endIndex="
+            + str(amount)
         )
         # TODO make this return a list of MatchHistory
-        return msgspec.json.decode(history.content, type=HistoryMatchResponse).History
+        return _history_decoder.decode(history.content).History
 
     async def get_match_details(self, match_id: str) -> MatchDetails:
-        match = await self.client.get(
-            f"{await self.get_pd_server()}{API.MATCHES}/{match_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return msgspec.json.decode(match.content, type=MatchDetails)
+        match = await self._get(self._pd_matches_prefix + match_id)
+        return _match_details_decoder.decode(match.content)
+
+    async def get_match_details_bulk(
+        self, match_ids: list[str], concurrency: int = 8
+    ) -> list[MatchDetails]:
+        # capped so a long history doesn't trip Riot's rate limits
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(match_id: str) -> MatchDetails:
+            async with semaphore:
+                return await self.get_match_details(match_id)
+
+        return list(await asyncio.gather(*map(fetch, match_ids)))
+
+    async def get_border_level(
+        self, match_id: str, player_id: str | None = None
+    ) -> str | None:
+        if player_id is None:
+            player_id = self._player_id
+
+        match = await self._get(self._pd_matches_prefix + match_id)
+        # only decode the players' ids and borders, the rest of the match is skipped
+        players = _match_borders_decoder.decode(match.content).players
+        player = next((p for p in players if p.player_id == player_id), None)
+        return None if player is None else player.border_level
 
     async def get_leaderboard(
         self,
@@ -200,196 +307,111 @@ class Valorant:
         amount: int = 510,
         username: str | None = None,
     ) -> LeaderBoard:
-        leaderboard = await self.client.get(
-            (
-                f"{await self.get_pd_server()}{API.LEADERBOARD}/{season_id}?startIndex={start}&size={amount}"
-                + f"&query={username}"
-                if username
-                else ""
-            ),
-            headers={
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        url = (
+            self._pd_leaderboard_prefix
+            + season_id
+            + "?startIndex="
+            + str(start)
+            + "&size="
+            + str(amount)
         )
-        return msgspec.json.decode(leaderboard.content, type=LeaderBoard)
+        if username:
+            url += f"&query={quote(username)}"
+
+        leaderboard = await self._get(url)
+        return _leaderboard_decoder.decode(leaderboard.content)
 
     async def get_penalties(self) -> dict:
-        penalties = await self.client.get(
-            f"{await self.get_pd_server()}{API.PENALTIES}",
-            headers={
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return penalties.json()
+        return _json(await self._get(self._url_penalties))
 
     async def get_config(self) -> dict:
-        region = await self.get_region()
-        config = await self.client.get(
-            f"{await self.get_pd_server()}{API.CONFIG}/{region.region}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return config.json()
+        return await self._cached_get(self._url_config)
 
     async def get_prices(self) -> dict:
-        prices = await self.client.get(
-            f"{await self.get_pd_server()}{API.PRICES}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-
-        return prices.json()
+        return await self._cached_get(self._url_prices)
 
     async def get_store(self) -> dict:
-        store = await self.client.get(
-            f"{await self.get_pd_server()}{API.STORE}/{(await self.get_user()).player_id}",
-            headers={
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "Content-Type": "application/json",
-            },
-        )
-
-        return store.json()
+        return _json(await self._get(self._url_store))
 
     async def get_wallet(self) -> dict:
-        wallet = await self.client.get(
-            f"{await self.get_pd_server()}{API.WALLET}/{(await self.get_user()).player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return wallet.json()
+        return _json(await self._get(self._url_wallet))
 
     async def get_items(self, item_type: str) -> dict:
-        items = await self.client.get(
-            f"{await self.get_pd_server()}{API.OWNED}/{(await self.get_user()).player_id}/{item_type}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return items.json()
+        return _json(await self._get(self._pd_owned_prefix + item_type))
 
     async def get_pregame_id(self, player_id: str | None = None) -> dict:
         if player_id is None:
-            player_id = (await self.get_user()).player_id
-
-        pregame = await self.client.get(
-            f"{await self.get_glz_server()}{API.PREGAME_PLAYER}/{player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
+            player_id = self._player_id
 
-        return pregame.json()
+        return _json(await self._get(self._glz_pregame_player_prefix + player_id))
 
     async def get_pregame_match(self, pregame_match_id: str | None = None) -> dict:
         if pregame_match_id is None:
             pregame_match_id = (await self.get_pregame_id())["MatchID"]
 
-        pregame_match = await self.client.get(
-            f"{await self.get_glz_server()}{API.PREGAME_MATCH}/{pregame_match_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return pregame_match.json()
+        return _json(await self._get(self._glz_pregame_match_prefix + pregame_match_id))
 
     async def get_pregame_loadout(self, pregame_match_id: str | None = None) -> dict:
         if pregame_match_id is None:
             pregame_match_id = (await self.get_pregame_id())["MatchID"]
 
-        pregame_loadout = await self.client.get(
-            f"{await self.get_glz_server()}{API.PREGAME_MATCH}/{pregame_match_id}/loadouts",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        return _json(
+            await self._get(
+                self._glz_pregame_match_prefix + pregame_match_id + "/loadouts"
+            )
         )
-        return pregame_loadout.json()
 
     async def select_agent(
         self, agent_id: str, pregame_match_id: str | None = None
     ) -> dict:
         if pregame_match_id is None:
-            pregame_match_id = self.get_pregame_id()
-
-        agent_select = await self.client.post(
-            f"{await self.get_glz_server()}{API.MATCHES}/{pregame_match_id}/select/{agent_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id())["MatchID"]
+
+        return _json(
+            await self._post(
+                self._glz_pregame_match_prefix
+                + pregame_match_id
+                + "/select/"
+                + agent_id
+            )
         )
-        return agent_select.json()
 
     async def lock_agent(
         self, agent_id: str, pregame_match_id: str | None = None
     ) -> dict:
         if pregame_match_id is None:
-            pregame_match_id = self.get_pregame_id()
-
-        agent_lock = await self.client.post(
-            f"{await self.get_glz_server()}{API.MATCHES}/{pregame_match_id}/lock/{agent_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id())["MatchID"]
+
+        return _json(
+            await self._post(
+                self._glz_pregame_match_prefix
+                + pregame_match_id
+                + "/lock/"
+                + agent_id
+            )
         )
-        return agent_lock.json()
 
     async def quit_pregame(self, pregame_match_id: str | None = None) -> dict:
         if pregame_match_id is None:
-            pregame_match_id = self.get_pregame_id()
-
-        pregame_quit = await self.client.post(
-            f"{await self.get_glz_server()}{API.MATCHES}/{pregame_match_id}/quit",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id())["MatchID"]
+
+        return _json(
+            await self._post(
+                self._glz_pregame_match_prefix + pregame_match_id + "/quit"
+            )
         )
-        return pregame_quit.json()
 
     async def get_current_game_player(self, player_id: str | None = None) -> dict:
         if player_id is None:
-            player_id = (await self.get_user()).player_id
-
-        current_game_player = await self.client.get(
-            f"{await self.get_glz_server()}{API.CURRENT_GAME_PLAYER}/{player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return current_game_player.links
+            player_id = self._player_id
+
+        return _json(await self._get(self._glz_current_player_prefix + player_id))
 
     async def get_current_game_match(self, current_match_id: str | None = None) -> dict:
         if current_match_id is None:
             current_match_id = (await self.get_pregame_id())["MatchID"]
 
-        current_game_match = await self.client.get(
-            f"{await self.get_glz_server()}{API.CURRENT_GAME_MATCH}/{current_match_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return current_game_match.json()
+        return _json(await self._get(self._glz_current_match_prefix + current_match_id))
 
     async def get_current_game_loadout(
         self, current_match_id: str | None = None
@@ -397,36 +419,28 @@ class Valorant:
         if current_match_id is None:
             current_match_id = (await self.get_pregame_id())["MatchID"]
 
-        current_game_loadout = await self.client.get(
-            f"{await self.get_glz_server()}{API.CURRENT_GAME_MATCH}/{current_match_id}/loadouts",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        return _json(
+            await self._get(
+                self._glz_current_match_prefix + current_match_id + "/loadouts"
+            )
         )
-        return current_game_loadout.json()
 
     async def get_item_upgrades(self) -> dict:
-        item_upgrades = await self.client.get(
-            f"{await self.get_pd_server()}{API.ITEM_UPGRADES}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-
-        return item_upgrades.json()
+        return await self._cached_get(self._url_item_upgrades)
 
     async def get_contracts(self, player_id: str | None = None) -> dict:
         if player_id is None:
-            player_id = (await self.get_user()).player_id
-
-        contracts = await self.client.get(
-            f"{await self.get_pd_server()}{API.CONTRACTS}/{player_id}",
-            headers={
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            player_id = self._player_id
+
+        return _json(await self._get(self._pd_contracts_prefix + player_id))
+
+    async def bulk_profile(self) -> tuple[dict, dict, Loadout, list[HistoryMatch]]:
+        # wallet and loadout only exist for the logged in account, so the whole
+        # profile is always the logged in player's
+        mmr, wallet, loadout, history = await asyncio.gather(
+            self.get_player_mmr(),
+            self.get_wallet(),
+            self.get_loadout(),
+            self.get_match_history(),
         )
-        return contracts.json()
+        return mmr, wallet, loadout, history
@@ -1,11 +1,14 @@
 import abc
 import asyncio
+import logging
 import ssl
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
 from valorant import Valorant
-from valorant.constants import xmpp_regions, xmpp_servers
+from valorant.constants import xmpp_entries
+
+logger = logging.getLogger(__name__)
 
 
 class XMPP(abc.ABC):
@@ -32,8 +35,7 @@ class XMPP(abc.ABC):
         self.writer: asyncio.StreamWriter | None = None
 
         self.region = self.val.get_region()
-        self.xmpp_region = xmpp_regions[self.region.region]
-        self.xmpp_server = xmpp_servers[self.xmpp_region]
+        self.xmpp_region, self.xmpp_server = xmpp_entries[self.region.region]
 
         self.context = ssl.create_default_context()
         self.context.check_hostname = True
@@ -117,7 +119,7 @@ class XMPP(abc.ABC):
         self.reader, self.writer = await asyncio.open_connection(
             host=self.xmpp_server, port=5223, ssl=self.context
         )
-        print("Connected")
+        logger.debug("Connected to %s", self.xmpp_server)
 
     async def send(self, message: bytes):
         self.writer.write(message)
@@ -126,7 +128,7 @@ class XMPP(abc.ABC):
     async def close(self):
         """Closes the XMPP client connection."""
 
-        print("Closing connection...")
+        logger.debug("Closing connection...")
         self.writer.close()
         await self.writer.wait_closed()
 
@@ -174,7 +176,7 @@ class XMPP(abc.ABC):
 
         await self.send(b"<presence/>")
         await self.reader.readuntil(b"</presence>")
-        print("ended auth")
+        logger.debug("Auth flow finished")
 
     async def add_friend(self, name: str, tag: str) -> None:
         await self.send(f"<iq id=\"roster_add_10\" type=\"set\"><query xmlns=\"jabber:iq:riotgames:roster\"><item "
@@ -189,7 +191,7 @@ class XMPP(abc.ABC):
                 for root in xml_element:
                     processor = self.processors.get(root.tag)
                     if processor is None:
-                        print("Processor not implemented for" + root.tag)
+                        logger.debug("Processor not implemented for %s", root.tag)
                         continue
 
                     await self.processors[root.tag](root)